@@ -3,7 +3,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import ast
-import importlib.util
 import os
 from typing import TypeVar
 
@@ -23,18 +22,33 @@ __all__ = (
 )
 
 
+# file_path -> (mtime_ns, size, {class_name: file_path})
+_FILE_CLASSES_CACHE: dict[str, tuple[int, int, dict[str, str]]] = {}
+
+
 def get_file_classes(file_path):
+    st = os.stat(file_path)
+    cached = _FILE_CLASSES_CACHE.get(file_path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return dict(cached[2])
+
     with open(file_path) as file:
         file_content = file.read()
 
-    tree = ast.parse(file_content)
-
     class_file_dict = {}
-    for node in tree.body:
-        if isinstance(node, ast.ClassDef):
-            class_file_dict[node.name] = file_path
-
-    return class_file_dict
+    # Files without the keyword cannot define a class; skip the parser.
+    if "class" in file_content:
+        tree = ast.parse(file_content)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                class_file_dict[node.name] = file_path
+
+    _FILE_CLASSES_CACHE[file_path] = (
+        st.st_mtime_ns,
+        st.st_size,
+        class_file_dict,
+    )
+    return dict(class_file_dict)
 
 
 def get_class_file_registry(folder_path, pattern_list):
@@ -60,14 +74,16 @@ if not LION_CLASS_FILE_REGISTRY:
 
 
 def get_class_objects(file_path):
+    import importlib.util
+
     class_objects = {}
     spec = importlib.util.spec_from_file_location("module.name", file_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
 
-    for class_name in dir(module):
-        obj = getattr(module, class_name)
-        if isinstance(obj, type):
+    # Only classes defined in the file itself, not ones it imports
+    for class_name, obj in vars(module).items():
+        if isinstance(obj, type) and obj.__module__ == module.__name__:
             class_objects[class_name] = obj
 
     return class_objects
@@ -29,12 +29,12 @@ class ConcurrentChunkExecutor(ConcurrentExecutor):
             if hasattr(res, "instruct_models"):
                 instructs: list[Instruct] = res.instruct_models
                 ress = []
-                async for chunk_result in await bcall(
+                async for chunk_result in bcall(
                     instructs,
                     self.instruct_concurrent_single,
                     execute_branch=self.execute_branch,
                     batch_size=self.params.chunk_size,
-                    **self.params.rcall_params.to_dict(),
+                    **self.params.rcall_params.to_call_kwargs(),
                 ):
                     ress.extend(chunk_result)
 
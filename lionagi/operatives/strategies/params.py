@@ -4,7 +4,7 @@
 
 from typing import Any, Literal
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from lionagi.operatives.instruct.instruct import (
     LIST_INSTRUCT_FIELD_MODEL,
@@ -15,7 +15,13 @@ from lionagi.session.session import Branch, Session
 
 
 class RCallParams(SchemaModel):
-    """Parameters for remote function calls."""
+    """Parameters for remote function calls.
+
+    Instances are immutable; use `model_copy(update=...)` to derive a
+    variant.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     timeout: float = Field(
         default=60, description="Timeout for remote function call"
@@ -30,6 +36,15 @@ class RCallParams(SchemaModel):
         default=2, description="Backoff factor for retry delay"
     )
 
+    def to_call_kwargs(self) -> dict[str, Any]:
+        """Map these settings onto `alcall`/`bcall` keyword arguments."""
+        return {
+            "retry_timeout": self.timeout,
+            "num_retries": self.max_retries,
+            "retry_delay": self.retry_delay,
+            "backoff_factor": self.retry_backoff,
+        }
+
 
 class StrategyParams(SchemaModel):
     """Base parameters for execution strategies."""
@@ -120,7 +135,9 @@ class ChunkStrategyParams(StrategyParams):
     rcall_params: RCallParams = Field(default_factory=RCallParams)
 
     @field_validator("rcall_params", mode="before")
-    def validate_rcall_params(cls, v: dict) -> RCallParams:
+    def validate_rcall_params(cls, v: dict | RCallParams) -> RCallParams:
+        if isinstance(v, RCallParams):
+            return v
         return RCallParams(**v)
 
 
@@ -147,5 +164,7 @@ class HybridStrategyParams(ChunkStrategyParams):
         return v
 
     @field_validator("inner_rcall_params", mode="before")
-    def validate_inner_rcall_params(cls, v: dict):
+    def validate_inner_rcall_params(cls, v: dict | RCallParams) -> RCallParams:
+        if isinstance(v, RCallParams):
+            return v
         return RCallParams(**v)
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+import time as t_
 from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import Any, Generic, TypeAlias, TypeVar
@@ -19,8 +22,7 @@ from pydantic import (
 
 from lionagi._class_registry import get_class
 from lionagi._errors import IDError
-from lionagi.settings import Settings
-from lionagi.utils import UNDEFINED, time, to_dict
+from lionagi.utils import UNDEFINED, to_dict
 
 from .._concepts import Collective, Observable, Ordering
 
@@ -32,6 +34,32 @@ __all__ = (
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _ts_to_dt(ts: float, /) -> datetime:
+    """Converts a timestamp to a datetime, caching recent results.
+
+    Datetimes are immutable, so elements rehydrated from the same batch
+    can share one instance per timestamp.
+    """
+    return datetime.fromtimestamp(ts)
+
+
+# Variant and version bits that UUID(..., version=4) forces
+_UUID4_MASK = (0xC000 << 48) | (0xF000 << 64)
+_UUID4_BITS = (0x8000 << 48) | (4 << 76)
+
+
+@functools.lru_cache(maxsize=256)
+def _full_class_name(cls: type, /) -> str:
+    """Returns the fully qualified name of `cls`, caching recent classes.
+
+    The cache is bounded so classes created at runtime are not kept alive
+    by it. The name is interned so every `lion_class` entry written by
+    `to_dict` shares one string object that compares by identity.
+    """
+    return sys.intern(str(cls).split("'")[1])
+
+
 class IDType:
     """Represents a UUIDv4-based identifier.
 
@@ -41,9 +69,11 @@ class IDType:
 
     Attributes:
         _id (UUID): The wrapped UUID object.
+        _hash (int): The hash of `_id`, filled in on first use.
+        _str (str): The string form of `_id`, filled in on first use.
     """
 
-    __slots__ = ("_id",)
+    __slots__ = ("_id", "_hash", "_str")
 
     def __init__(self, id: UUID) -> None:
         """Initializes an IDType instance.
@@ -71,6 +101,13 @@ class IDType:
         if isinstance(value, IDType):
             return value
         try:
+            if isinstance(value, UUID):
+                # Same version/variant forcing as below, minus the
+                # str() and hex-parsing round trip; a UUID that already
+                # carries the v4 bits is used as is
+                if value.int & _UUID4_MASK == _UUID4_BITS:
+                    return cls(value)
+                return cls(UUID(int=value.int, version=4))
             return cls(UUID(str(value), version=4))
         except ValueError:
             raise IDError(f"Invalid ID: {value}") from None
@@ -90,7 +127,12 @@ class IDType:
         Returns:
             str: The string form of this IDType's UUID.
         """
-        return str(self._id)
+        # UUID.__str__ formats the hex digits in Python; do it only once
+        try:
+            return self._str
+        except AttributeError:
+            self._str = str(self._id)
+            return self._str
 
     def __repr__(self) -> str:
         """Returns the unambiguous string representation of this IDType.
@@ -111,7 +153,9 @@ class IDType:
         """
         if not isinstance(other, IDType):
             return NotImplemented
-        return self._id == other._id
+        # Compare the 128-bit integers directly rather than going through
+        # UUID.__eq__, which is implemented in Python
+        return self._id.int == other._id.int
 
     def __hash__(self) -> int:
         """Returns a hash based on the underlying UUID.
@@ -119,7 +163,12 @@ class IDType:
         Returns:
             int: The hash of this object, allowing IDType to be dictionary keys.
         """
-        return hash(self._id)
+        # UUID.__hash__ is implemented in Python; compute it only once
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._id)
+            return self._hash
 
 
 class Element(BaseModel, Observable):
@@ -152,10 +201,10 @@ class Element(BaseModel, Observable):
         description="Unique identifier for this element.",
         frozen=True,
     )
+    # A Unix timestamp is the same in every timezone, so the configured
+    # timezone does not need to be looked up to produce one
     created_at: float = Field(
-        default_factory=lambda: time(
-            tz=Settings.Config.TIMEZONE, type_="timestamp"
-        ),
+        default_factory=t_.time,
         title="Creation Timestamp",
         description="Timestamp of element creation.",
         frozen=True,
@@ -209,7 +258,7 @@ class Element(BaseModel, Observable):
             ValueError: If `val` cannot be converted to a float timestamp.
         """
         if val is None:
-            return time(tz=Settings.Config.TIMEZONE, type_="timestamp")
+            return t_.time()
         if isinstance(val, float):
             return val
         if isinstance(val, datetime):
@@ -251,7 +300,7 @@ class Element(BaseModel, Observable):
         Returns:
             datetime: The creation time in UTC.
         """
-        return datetime.fromtimestamp(self.created_at)
+        return _ts_to_dt(self.created_at)
 
     def __eq__(self, other: Any) -> bool:
         """Compares two Element instances by their ID.
@@ -291,7 +340,7 @@ class Element(BaseModel, Observable):
             str: The class name or fully qualified name.
         """
         if full:
-            return str(cls).split("'")[1]
+            return _full_class_name(cls)
         return cls.__name__
 
     def to_dict(self) -> dict:
@@ -303,8 +352,11 @@ class Element(BaseModel, Observable):
             dict: The dictionary representation of this Element.
         """
         dict_ = self.model_dump()
-        dict_["metadata"].update({"lion_class": self.class_name(full=True)})
-        return {k: v for k, v in dict_.items() if v is not UNDEFINED}
+        dict_["metadata"]["lion_class"] = self.class_name(full=True)
+        # model_dump already returns a fresh dict; drop UNDEFINED in place
+        for k in [k for k, v in dict_.items() if v is UNDEFINED]:
+            del dict_[k]
+        return dict_
 
     @classmethod
     def from_dict(cls, data: dict, /) -> Element:
@@ -2,24 +2,30 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import array
 import asyncio
 import contextlib
+import contextvars
 import copy as _copy
 import functools
 import json
 import logging
+import os
 import re
+import secrets
 import shutil
 import subprocess
 import sys
 import time as t_
-import uuid
-import xml.etree.ElementTree as ET
+import weakref
 from abc import ABC
+from collections import deque
 from collections.abc import (
     AsyncGenerator,
+    Awaitable,
     Callable,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
@@ -27,9 +33,11 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from functools import lru_cache, partial
-from inspect import isclass
+from functools import partial
+from inspect import CO_COROUTINE, isclass
+from itertools import islice
 from pathlib import Path
+from types import FunctionType
 from typing import (
     Any,
     Literal,
@@ -40,10 +48,11 @@ from typing import (
     overload,
 )
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 from pydantic_core import PydanticUndefinedType
 from typing_extensions import Self
 
+from ._errors import ExecutionError
 from .settings import Settings
 
 R = TypeVar("R")
@@ -71,6 +80,7 @@ __all__ = (
     "lcall",
     "alcall",
     "bcall",
+    "CircuitBreaker",
     "create_path",
     "time",
     "fuzzy_parse_json",
@@ -234,15 +244,72 @@ def copy(obj: T, /, *, deep: bool = True, num: int = 1) -> T | list[T]:
     if num < 1:
         raise ValueError("Number of copies must be at least 1")
 
-    copy_func = _copy.deepcopy if deep else _copy.copy
+    copy_func = _deepcopy_func(obj) if deep else _copy.copy
     return [copy_func(obj) for _ in range(num)] if num > 1 else copy_func(obj)
 
 
+# Immutable types that deepcopy returns as-is
+_ATOMIC_COPY_TYPES = frozenset(
+    {str, int, float, complex, bool, bytes, Decimal, type(None)}
+)
+
+
+def _deepcopy_func(obj: Any, /) -> Callable[[Any], Any]:
+    """Pick the cheapest function that deep-copies `obj` faithfully.
+
+    Immutable scalars need no copy, and a plain list or dict holding only
+    such scalars is fully copied by a shallow copy. Anything else goes
+    through `copy.deepcopy`, which handles shared references and cycles.
+    """
+    t = type(obj)
+    if t in _ATOMIC_COPY_TYPES:
+        return _identity
+    if t is list and _ATOMIC_COPY_TYPES.issuperset(map(type, obj)):
+        return list.copy
+    if (
+        t is dict
+        and _ATOMIC_COPY_TYPES.issuperset(map(type, obj))
+        and _ATOMIC_COPY_TYPES.issuperset(map(type, obj.values()))
+    ):
+        return dict.copy
+    return _copy.deepcopy
+
+
+def _identity(obj: T, /) -> T:
+    return obj
+
+
+_ARRAY_TYPECODE_TYPES = {
+    **dict.fromkeys("bBhHiIlLqQ", int),
+    **dict.fromkeys("fd", float),
+    **dict.fromkeys("uw", str),
+}
+
+
+def _container_element_type(input_: Any, /) -> type | None:
+    """Return the element type a typed container declares, if any."""
+    if isinstance(input_, array.array):
+        return _ARRAY_TYPECODE_TYPES.get(input_.typecode)
+    dtype = getattr(input_, "dtype", None)
+    # Object dtypes can hold anything, so they still need a scan
+    if dtype is None or getattr(dtype, "kind", "O") == "O":
+        return None
+    element_type = getattr(dtype, "type", None)
+    return element_type if isinstance(element_type, type) else None
+
+
 def is_same_dtype(
     input_: list[T] | dict[Any, T],
     dtype: type | None = None,
     return_dtype: bool = False,
 ) -> bool | tuple[bool, type | None]:
+    # Typed containers (numpy arrays, pandas Series, array.array) already
+    # know their element type, so answer from it without scanning.
+    container_type = _container_element_type(input_)
+    if container_type is not None:
+        result = dtype is None or issubclass(container_type, dtype)
+        return (result, dtype or container_type) if return_dtype else result
+
     if not input_:
         # If empty, trivially true. dtype is None since no elements exist.
         return (True, None) if return_dtype else True
@@ -262,15 +329,53 @@ def is_same_dtype(
         first_val = input_[0]
         if dtype is None:
             dtype = type(first_val) if first_val is not None else None
-        # Check all elements including the first
-        result = all(isinstance(e, dtype) for e in input_)
+        # Check each distinct element type once instead of every element;
+        # on a miss, fall back to isinstance, which also honours objects
+        # that report a different __class__ (proxies, spec'd mocks)
+        result = all(
+            issubclass(t, dtype) for t in set(map(type, input_))
+        ) or all(isinstance(e, dtype) for e in input_)
 
     return (result, dtype) if return_dtype else result
 
 
-@lru_cache(maxsize=None)
+_IS_CORO_CACHE: weakref.WeakKeyDictionary[Callable, bool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def is_coro_func(func: Callable[..., Any]) -> bool:
-    return asyncio.iscoroutinefunction(func)
+    """Check whether `func` is a coroutine function, memoizing the result.
+
+    Results are cached weakly on the callable, so short-lived closures do not
+    accumulate and unhashable or non-weakrefable callables still work (they
+    are simply inspected on every call). Callable instances with an async
+    `__call__` are treated as coroutine functions.
+
+    Plain functions are answered from their code flags without touching the
+    cache. Functions carrying extra attributes (decorated functions, or ones
+    with a coroutine marker) go through the weak cache; the caller's
+    function object is never modified.
+    """
+    if type(func) is FunctionType:
+        if func.__code__.co_flags & CO_COROUTINE:
+            return True
+        # Only an attribute such as a coroutine marker can change the answer
+        if not func.__dict__:
+            return False
+
+    try:
+        return _IS_CORO_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    result = asyncio.iscoroutinefunction(func)
+    if not result and not isinstance(func, type):
+        result = asyncio.iscoroutinefunction(getattr(func, "__call__", None))
+
+    with contextlib.suppress(TypeError):
+        _IS_CORO_CACHE[func] = result
+    return result
 
 
 async def custom_error_handler(
@@ -280,10 +385,19 @@ async def custom_error_handler(
         if is_coro_func(error_map[type(error)]):
             return await error_map[type(error)](error)
         return error_map[type(error)](error)
-    logging.error(f"Unhandled error: {error}")
+    logger.error("Unhandled error: %s", error)
     raise error
 
 
+# Iterables that to_list keeps whole instead of flattening
+_SKIP_TYPES = (str, bytes, bytearray, Mapping, BaseModel, Enum)
+_SKIP_TUPLE_SET_TYPES = _SKIP_TYPES + (tuple, set, frozenset)
+_UNDEFINED_TYPES = (UndefinedType, PydanticUndefinedType)
+# Element types to_list passes through unchanged in a plain list
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, Decimal, type(None)})
+_SCALAR_TYPES_NOT_NONE = _SCALAR_TYPES - {type(None)}
+
+
 @overload
 def to_list(
     input_: None | UndefinedType | PydanticUndefinedType,
@@ -357,51 +471,25 @@ def to_list(
         [1, 2]
     """
 
-    def _process_list(
-        lst: list[Any],
-        flatten: bool,
-        dropna: bool,
-    ) -> list[Any]:
-        """Process list according to flatten and dropna options.
+    def _process_list(lst: Iterable[Any], dropna: bool) -> list[Any]:
+        """Process list without flattening, keeping nested structure.
 
         Args:
-            lst: Input list to process.
-            flatten: Whether to flatten nested iterables.
+            lst: Input iterable to process.
             dropna: Whether to remove None/undefined values.
 
         Returns:
-            list: Processed list based on specified options.
+            list: Processed list with nested iterables converted to lists.
         """
         result = []
-        skip_types = (str, bytes, bytearray, Mapping, BaseModel, Enum)
-
-        if not flatten_tuple_set:
-            skip_types += (tuple, set, frozenset)
-
         for item in lst:
-            if dropna and (
-                item is None
-                or isinstance(item, (UndefinedType, PydanticUndefinedType))
-            ):
+            if dropna and (item is None or isinstance(item, _UNDEFINED_TYPES)):
                 continue
 
-            is_iterable = isinstance(item, Iterable)
-            should_skip = isinstance(item, skip_types)
-
-            if is_iterable and not should_skip:
-                item_list = list(item)
-                if flatten:
-                    result.extend(
-                        _process_list(
-                            item_list, flatten=flatten, dropna=dropna
-                        )
-                    )
-                else:
-                    result.append(
-                        _process_list(
-                            item_list, flatten=flatten, dropna=dropna
-                        )
-                    )
+            if getattr(type(item), "__iter__", None) is not None and (
+                not isinstance(item, skip_types)
+            ):
+                result.append(_process_list(item, dropna=dropna))
             else:
                 result.append(item)
 
@@ -456,34 +544,94 @@ def to_list(
     if unique and not flatten:
         raise ValueError("unique=True requires flatten=True")
 
-    initial_list = _to_list_type(input_, use_values=use_values)
-    processed = _process_list(initial_list, flatten=flatten, dropna=dropna)
+    if type(input_) is list and _SCALAR_TYPES.issuperset(map(type, input_)):
+        # Flat list of scalars: nothing to flatten or convert, so skip the
+        # per-item Iterable checks. Only None may need dropping.
+        processed = (
+            [x for x in input_ if x is not None] if dropna else input_[:]
+        )
+    else:
+        skip_types = (
+            _SKIP_TYPES if flatten_tuple_set else _SKIP_TUPLE_SET_TYPES
+        )
+        initial_list = _to_list_type(input_, use_values=use_values)
+        if flatten:
+            processed = list(
+                _flatten_iter(
+                    initial_list, skip_types=skip_types, dropna=dropna
+                )
+            )
+        else:
+            processed = _process_list(initial_list, dropna=dropna)
 
     if unique:
-        seen = set()
-        out = []
         try:
-            return [x for x in processed if not (x in seen or seen.add(x))]
+            # Order-preserving dedup done entirely in C
+            return list(dict.fromkeys(processed))
         except TypeError:
-            for i in processed:
-                hash_value = None
-                try:
-                    hash_value = hash(i)
-                except TypeError:
-                    if isinstance(i, (BaseModel, Mapping)):
-                        hash_value = hash_dict(i)
-                    else:
-                        raise ValueError(
-                            "Unhashable type encountered in list unique value processing."
-                        )
-                if hash_value not in seen:
-                    seen.add(hash_value)
-                    out.append(i)
-            return out
+            pass
+
+        seen = set()
+        out = []
+        for i in processed:
+            hash_value = None
+            try:
+                hash_value = hash(i)
+            except TypeError:
+                if isinstance(i, (BaseModel, Mapping)):
+                    hash_value = hash_dict(i)
+                else:
+                    raise ValueError(
+                        "Unhashable type encountered in list unique value processing."
+                    )
+            if hash_value not in seen:
+                seen.add(hash_value)
+                out.append(i)
+        return out
 
     return processed
 
 
+def _flatten_iter(
+    items: Iterable[Any],
+    /,
+    skip_types: tuple[type, ...],
+    dropna: bool = False,
+) -> Iterator[Any]:
+    """Lazily flatten nested iterables using an explicit stack.
+
+    Iterables that are instances of `skip_types` are yielded as-is. With
+    `dropna`, None and undefined values are dropped at every level.
+    Iterability is tested by looking up `__iter__` on the item's type, which
+    matches `isinstance(item, Iterable)` (classes such as `str` are not
+    iterable themselves) without the ABC subclass hook on every item.
+
+    Plain lists and scalars are dispatched on their exact type first, so
+    `skip_types` must not include `list` and must include `str` and `bytes`.
+    """
+    stack = [iter(items)]
+    while stack:
+        for item in stack[-1]:
+            t = type(item)
+            if t is list:
+                stack.append(iter(item))
+                break
+            if t in _SCALAR_TYPES:
+                if not (dropna and item is None):
+                    yield item
+                continue
+            if dropna and isinstance(item, _UNDEFINED_TYPES):
+                continue
+            if getattr(type(item), "__iter__", None) is not None and (
+                not isinstance(item, skip_types)
+            ):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
+
+
 class ToListParams(Params):
     flatten: bool = False
     dropna: bool = False
@@ -583,18 +731,17 @@ def lcall(
             "unique_output requires flatten or dropna for post-processing."
         )
 
-    # Process elements and collect results
+    # Process elements and collect results. list.extend keeps the items
+    # appended before an exception, so an InterruptedError still returns
+    # the partial results.
     out = []
-    append = out.append
-
-    for item in input_:
-        try:
-            result = func(item, *args, **kwargs)
-            append(result)
-        except InterruptedError:
-            return out
-        except Exception:
-            raise
+    try:
+        if args or kwargs:
+            out.extend(func(item, *args, **kwargs) for item in input_)
+        else:
+            out.extend(map(func, input_))
+    except InterruptedError:
+        return out
 
     # Apply output processing if requested
     if flatten or dropna:
@@ -609,21 +756,32 @@ def lcall(
     return out
 
 
+@functools.lru_cache(maxsize=256)
+def _model_field_names(model: type[BaseModel], /) -> frozenset[str]:
+    """Declared field names of a model class, cached for recent classes."""
+    return frozenset(model.model_fields)
+
+
 class CallParams(Params):
     """params class for high order function with additional handling of lower order function parameters, can take arbitrary number of args and kwargs, args need to be in agrs=, kwargs can be passed as is"""
 
-    args: list = []
-    kwargs: dict = {}
+    args: list = Field(default_factory=list)
+    kwargs: dict = Field(default_factory=dict)
 
     @model_validator(mode="before")
+    @classmethod
     def _validate_data(cls, data: dict):
+        declared = _model_field_names(cls)
         _d = {}
-        for k in list(data.keys()):
-            if k in cls.keys():
-                _d[k] = data.pop(k)
+        extra = {}
+        for k, v in data.items():
+            if k in declared:
+                _d[k] = v
+            else:
+                extra[k] = v
         _d.setdefault("args", [])
-        _d.setdefault("kwargs", {})
-        _d["kwargs"].update(data)
+        # copy so the caller's kwargs mapping is never mutated in place
+        _d["kwargs"] = {**_d.get("kwargs", {}), **extra}
         return _d
 
     def __call__(self, *args, **kwargs):
@@ -658,6 +816,88 @@ class LCallParams(CallParams):
         )
 
 
+if sys.version_info >= (3, 11):
+
+    async def _with_timeout(aw: Awaitable[T], timeout: float, /) -> T:
+        """Await `aw`, raising TimeoutError after `timeout` seconds.
+
+        asyncio.timeout cancels the current task in place instead of
+        wrapping `aw` in a new Task the way asyncio.wait_for does.
+        """
+        async with asyncio.timeout(timeout):
+            return await aw
+
+else:
+
+    async def _with_timeout(aw: Awaitable[T], timeout: float, /) -> T:
+        """Await `aw`, raising TimeoutError after `timeout` seconds.
+
+        Falls back to asyncio.wait_for where asyncio.timeout is missing.
+        """
+        return await asyncio.wait_for(aw, timeout)
+
+
+async def _cancel_all(tasks: list[asyncio.Future], /) -> None:
+    """Cancel `tasks` and wait for them, retrieving any exceptions."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class CircuitBreaker:
+    """Track call outcomes and trip once failures dominate.
+
+    The breaker keeps the outcomes of the most recent `window` calls. Once at
+    least `min_samples` outcomes are recorded and the failure ratio reaches
+    `threshold`, the breaker opens and `alcall`/`bcall` stop issuing calls.
+
+    Args:
+        threshold: Failure ratio at which the breaker opens.
+        min_samples: Minimum number of recorded outcomes before opening.
+        window: Number of most recent outcomes considered.
+    """
+
+    __slots__ = ("threshold", "min_samples", "_outcomes", "_failures")
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        min_samples: int = 16,
+        window: int = 64,
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("require 1 <= min_samples <= window")
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._failures = 0
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a single call attempt."""
+        outcomes = self._outcomes
+        if len(outcomes) == outcomes.maxlen and not outcomes[0]:
+            self._failures -= 1
+        outcomes.append(ok)
+        if not ok:
+            self._failures += 1
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the recent failure ratio has tripped the breaker."""
+        total = len(self._outcomes)
+        return (
+            total >= self.min_samples
+            and self._failures / total >= self.threshold
+        )
+
+    def reset(self) -> None:
+        """Forget all recorded outcomes, closing the breaker."""
+        self._outcomes.clear()
+        self._failures = 0
+
+
 async def alcall(
     input_: list[Any],
     func: Callable[..., T],
@@ -678,6 +918,8 @@ async def alcall(
     dropna: bool = False,
     unique_output: bool = False,
     flatten_tuple_set: bool = False,
+    circuit_breaker: CircuitBreaker | None = None,
+    propagate_context: bool = True,
     **kwargs: Any,
 ) -> list[T] | list[tuple[T, float]]:
     """
@@ -691,7 +933,9 @@ async def alcall(
         unique_input (bool): If True and sanitize_input is True, input is made unique.
         num_retries (int): Number of retry attempts on exception.
         initial_delay (float): Initial delay before starting executions.
-        retry_delay (float): Delay between retries.
+        retry_delay (float): Delay between retries. With a delay of 0, retries
+            run back to back without yielding to the event loop; use a small
+            positive delay when other tasks need a chance to run.
         backoff_factor (float): Multiplier for delay after each retry.
         retry_default (Any): Default value if all retries fail.
         retry_timeout (float | None): Timeout for each function call.
@@ -702,6 +946,12 @@ async def alcall(
         dropna (bool): Remove None values from the final result if True.
         unique_output (bool): Deduplicate the output if True.
         flatten_tuple_set (bool): Tuples and sets will be flattened if True.
+        circuit_breaker (CircuitBreaker | None): Records the outcome of every
+            attempt; once it opens, remaining attempts are not issued.
+        propagate_context (bool): If True, sync functions run in a thread
+            (when retry_timeout is set) see the caller's context variables.
+            Disable for functions that do not read contextvars to skip the
+            per-call context copy.
         **kwargs: Additional arguments passed to func.
 
     Returns:
@@ -709,6 +959,7 @@ async def alcall(
 
     Raises:
         asyncio.TimeoutError: If a call times out and no default is provided.
+        ExecutionError: If the circuit breaker is open and no default is provided.
         Exception: If retries are exhausted and no default is provided.
     """
 
@@ -753,104 +1004,161 @@ async def alcall(
                     input_ = [input_]
 
     # Optional initial delay before processing
-    if initial_delay:
+    if initial_delay > 0:
         await asyncio.sleep(initial_delay)
 
-    semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+    loop = asyncio.get_running_loop()
     throttle_delay = throttle_period or 0
     coro_func = is_coro_func(func)
 
-    async def call_func(item: Any) -> T:
-        if coro_func:
-            # Async function
-            if retry_timeout is not None:
-                return await asyncio.wait_for(
-                    func(item, **kwargs), timeout=retry_timeout
-                )
-            else:
-                return await func(item, **kwargs)
-        else:
-            # Sync function
-            if retry_timeout is not None:
-                return await asyncio.wait_for(
-                    asyncio.to_thread(func, item, **kwargs),
-                    timeout=retry_timeout,
-                )
+    executor = None
+
+    # Pick the call strategy once rather than re-checking per item; func,
+    # kwargs and the timeout are bound as defaults to skip cell lookups.
+    if coro_func and retry_timeout is not None:
+
+        async def call_func(
+            item: Any, _f=func, _kw=kwargs, _to=retry_timeout
+        ) -> T:
+            return await _with_timeout(_f(item, **_kw), _to)
+
+    elif coro_func:
+
+        async def call_func(item: Any, _f=func, _kw=kwargs) -> T:
+            return await _f(item, **_kw)
+
+    elif retry_timeout is not None:
+        # With a concurrency limit, give the calls their own pool of that
+        # size rather than queueing behind the loop's shared default pool.
+        if max_concurrent:
+            executor = ThreadPoolExecutor(max_workers=max_concurrent)
+
+        async def call_func(
+            item: Any,
+            _f=func,
+            _kw=kwargs,
+            _to=retry_timeout,
+            _loop=loop,
+            _ex=executor,
+        ) -> T:
+            # Await the executor future directly: unlike to_thread's
+            # coroutine, it never needs wrapping in a Task.
+            if propagate_context:
+                call = partial(contextvars.copy_context().run, _f, item, **_kw)
             else:
-                return func(item, **kwargs)
+                call = partial(_f, item, **_kw)
+            return await _with_timeout(_loop.run_in_executor(_ex, call), _to)
 
-    async def execute_task(i: Any, index: int) -> Any:
-        start_time = asyncio.get_running_loop().time()
+    else:
+
+        async def call_func(item: Any, _f=func, _kw=kwargs) -> T:
+            return _f(item, **_kw)
+
+    async def execute_task(i: Any) -> Any:
+        if retry_timing:
+            start_time = loop.time()
         attempts = 0
         current_delay = retry_delay
         while True:
+            if circuit_breaker is not None and circuit_breaker.is_open:
+                if retry_default is UNDEFINED:
+                    raise ExecutionError("Circuit breaker is open.")
+                result = retry_default
+                break
             try:
                 result = await call_func(i)
-                if retry_timing:
-                    end_time = asyncio.get_running_loop().time()
-                    return index, result, end_time - start_time
-                else:
-                    return index, result
+                if circuit_breaker is not None:
+                    circuit_breaker.record(True)
+                break
             except asyncio.CancelledError as e:
                 raise e
 
-            except Exception:
+            except Exception as e:
+                if circuit_breaker is not None:
+                    circuit_breaker.record(False)
                 attempts += 1
                 if attempts <= num_retries:
-                    if current_delay:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Attempt %d/%d failed: %r, retrying...",
+                            attempts,
+                            num_retries + 1,
+                            e,
+                        )
+                    if current_delay > 0:
                         await asyncio.sleep(current_delay)
                         current_delay *= backoff_factor
-                    # Retry loop continues
-                else:
-                    # Exhausted retries
-                    if retry_default is not UNDEFINED:
-                        # Return default if provided
-                        if retry_timing:
-                            end_time = asyncio.get_running_loop().time()
-                            duration = end_time - (start_time or end_time)
-                            return index, retry_default, duration
-                        else:
-                            return index, retry_default
-                    # No default, re-raise
+                    continue
+                # Exhausted retries, re-raise unless a default is provided
+                if retry_default is UNDEFINED:
                     raise
+                result = retry_default
+                break
 
-    async def task_wrapper(item: Any, idx: int) -> Any:
-        if semaphore:
-            async with semaphore:
-                return await execute_task(item, idx)
-        else:
-            return await execute_task(item, idx)
-
-    # Create tasks
-    tasks = [task_wrapper(item, idx) for idx, item in enumerate(input_)]
-
-    # Collect results as they complete
-    results = []
-    for coro in asyncio.as_completed(tasks):
-        res = await coro
-        results.append(res)
-        if throttle_delay:
-            await asyncio.sleep(throttle_delay)
+        if retry_timing:
+            return result, loop.time() - start_time
+        return result
 
-    # Sort by original index
-    results.sort(key=lambda x: x[0])
+    tasks: list[asyncio.Future] = []
+    try:
+        if max_concurrent and max_concurrent < len(input_):
+            # A fixed pool of workers pulling from a shared iterator bounds
+            # concurrency without a semaphore round trip per item. A limit at
+            # least as wide as the input can never bind, so it is skipped.
+            results = [None] * len(input_)
+            pending = enumerate(input_)
+
+            async def worker() -> None:
+                for idx, item in pending:
+                    results[idx] = await execute_task(item)
+                    if throttle_delay > 0:
+                        await asyncio.sleep(throttle_delay)
+
+            tasks = [
+                asyncio.ensure_future(worker()) for _ in range(max_concurrent)
+            ]
+            await asyncio.gather(*tasks)
+        elif throttle_delay > 0:
+            # Pacing needs completion order, so collect as tasks finish and
+            # slot each result back into its input position.
+            async def indexed(idx: int, item: Any) -> tuple[int, Any]:
+                return idx, await execute_task(item)
+
+            tasks = [
+                asyncio.ensure_future(indexed(idx, item))
+                for idx, item in enumerate(input_)
+            ]
+            results = [None] * len(tasks)
+            for fut in asyncio.as_completed(tasks):
+                idx, res = await fut
+                results[idx] = res
+                await asyncio.sleep(throttle_delay)
+        else:
+            # gather already returns results in submission order
+            tasks = [
+                asyncio.ensure_future(execute_task(item)) for item in input_
+            ]
+            results = await asyncio.gather(*tasks)
+    except BaseException:
+        await _cancel_all(tasks)
+        raise
+    finally:
+        if executor is not None:
+            # Timed-out calls keep running in their threads; don't wait
+            executor.shutdown(wait=False)
 
     if retry_timing:
-        # (index, result, duration)
-        filtered = [
-            (r[1], r[2]) for r in results if not dropna or r[1] is not None
-        ]
-        return filtered
-    else:
-        # (index, result)
-        output_list = [r[1] for r in results]
+        # (result, duration)
+        return [r for r in results if not dropna or r[0] is not None]
+    if flatten or dropna or unique_output:
         return to_list(
-            output_list,
+            results,
             flatten=flatten,
             dropna=dropna,
             unique=unique_output,
             flatten_tuple_set=flatten_tuple_set,
         )
+    return results
 
 
 class ALCallParams(CallParams):
@@ -870,6 +1178,8 @@ class ALCallParams(CallParams):
     dropna: bool = False
     unique_output: bool = False
     flatten_tuple_set: bool = False
+    circuit_breaker: Any = None
+    propagate_context: bool = True
 
     async def __call__(self, input_: Any, func=None):
         if self.func is None and func is None:
@@ -893,10 +1203,76 @@ class ALCallParams(CallParams):
             dropna=self.dropna,
             unique_output=self.unique_output,
             flatten_tuple_set=self.flatten_tuple_set,
+            circuit_breaker=self.circuit_breaker,
+            propagate_context=self.propagate_context,
             **self.kwargs,
         )
 
 
+def _dedup_calls(func: Callable[..., T], /) -> Callable[..., T]:
+    """Wrap `func` so identical inputs share a single call.
+
+    Results are keyed on the (type, value) of the first positional argument,
+    so this is only safe for functions whose result depends on that argument
+    alone. Async calls still in flight are shared through a future;
+    unhashable inputs bypass the cache. A failed call is evicted so retries
+    issue a fresh call.
+    """
+    if is_coro_func(func):
+        shared: dict[Any, asyncio.Future] = {}
+
+        @functools.wraps(func)
+        async def wrapper(item: Any, /, **kwargs: Any) -> T:
+            key = (type(item), item)
+            try:
+                fut = shared.get(key)
+            except TypeError:
+                return await func(item, **kwargs)
+
+            if fut is not None:
+                # asyncio.wait never cancels `fut`, and only raises
+                # CancelledError if this waiter itself is cancelled
+                await asyncio.wait((fut,))
+                if fut.cancelled():
+                    # The owning call was abandoned, issue our own
+                    return await wrapper(item, **kwargs)
+                return fut.result()
+
+            fut = asyncio.get_running_loop().create_future()
+            shared[key] = fut
+            try:
+                result = await func(item, **kwargs)
+            except BaseException as e:
+                shared.pop(key, None)
+                if isinstance(e, Exception):
+                    fut.set_exception(e)
+                    fut.exception()  # mark as retrieved
+                else:
+                    fut.cancel()
+                raise
+            fut.set_result(result)
+            return result
+
+        return wrapper
+
+    done: dict[Any, Any] = {}
+
+    @functools.wraps(func)
+    def sync_wrapper(item: Any, /, **kwargs: Any) -> T:
+        key = (type(item), item)
+        try:
+            return done[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return func(item, **kwargs)
+        result = func(item, **kwargs)
+        done[key] = result
+        return result
+
+    return sync_wrapper
+
+
 async def bcall(
     input_: Any,
     func: Callable[..., T],
@@ -918,13 +1294,46 @@ async def bcall(
     dropna: bool = False,
     unique_output: bool = False,
     flatten_tuple_set: bool = False,
+    circuit_breaker: CircuitBreaker | None = None,
+    propagate_context: bool = True,
+    dedup: bool = False,
     **kwargs: Any,
 ) -> AsyncGenerator[list[T | tuple[T, float]], None]:
+    """
+    Process input in batches, applying `alcall` to each batch in turn.
+
+    Takes the same arguments as `alcall`, plus:
 
-    input_ = to_list(input_, flatten=True, dropna=True)
+    Args:
+        batch_size (int): Number of items per batch.
+        dedup (bool): If True, identical inputs share one call across the
+            whole invocation. Only safe for functions without side effects.
 
-    for i in range(0, len(input_), batch_size):
-        batch = input_[i : i + batch_size]  # noqa: E203
+    Yields:
+        list: The results of each batch, in input order.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    if dedup:
+        func = _dedup_calls(func)
+
+    # Same flattening as to_list(input_, flatten=True, dropna=True), but
+    # consumed lazily so the input is never materialized as a whole.
+    if type(input_) is list and _SCALAR_TYPES_NOT_NONE.issuperset(
+        map(type, input_)
+    ):
+        # Already flat with nothing to drop, so batch the list as is
+        items = iter(input_)
+    else:
+        if not isinstance(input_, (list, tuple, set, frozenset)):
+            input_ = (input_,)
+        items = _flatten_iter(
+            input_, skip_types=_SKIP_TUPLE_SET_TYPES, dropna=True
+        )
+
+    while batch := list(islice(items, batch_size)):
+        # An open circuit breaker is handled per item inside alcall, so
+        # short-circuited batches keep the same shape as normal ones
         yield await alcall(
             batch,
             func,
@@ -943,6 +1352,8 @@ async def bcall(
             dropna=dropna,
             unique_output=unique_output,
             flatten_tuple_set=flatten_tuple_set,
+            circuit_breaker=circuit_breaker,
+            propagate_context=propagate_context,
             **kwargs,
         )
 
@@ -965,6 +1376,9 @@ class BCallParams(CallParams):
     dropna: bool = False
     unique_output: bool = False
     flatten_tuple_set: bool = False
+    circuit_breaker: Any = None
+    propagate_context: bool = True
+    dedup: bool = False
 
     async def __call__(self, input_, func=None):
         if self.func is None and func is None:
@@ -989,6 +1403,9 @@ class BCallParams(CallParams):
             dropna=self.dropna,
             unique_output=self.unique_output,
             flatten_tuple_set=self.flatten_tuple_set,
+            circuit_breaker=self.circuit_breaker,
+            propagate_context=self.propagate_context,
+            dedup=self.dedup,
             **self.kwargs,
         )
 
@@ -1045,20 +1462,32 @@ def create_path(
 
     # Add timestamp if requested
     if timestamp:
-        ts_str = datetime.now().strftime(timestamp_format or "%Y%m%d%H%M%S")
+        # The default format needs no datetime object; custom formats still
+        # go through datetime, which also understands codes like %f.
+        ts_str = (
+            datetime.now().strftime(timestamp_format)
+            if timestamp_format
+            else t_.strftime("%Y%m%d%H%M%S", t_.localtime())
+        )
         name = f"{ts_str}_{name}" if time_prefix else f"{name}_{ts_str}"
 
     # Add random suffix if requested
     if random_hash_digits > 0:
-        # Use UUID4 and truncate its hex for random suffix
-        random_suffix = uuid.uuid4().hex[:random_hash_digits]
+        # Draw just enough random bytes for the requested hex digits
+        random_suffix = secrets.token_hex((random_hash_digits + 1) // 2)[
+            :random_hash_digits
+        ]
         name = f"{name}-{random_suffix}"
 
     full_path = directory / f"{name}{ext}"
 
-    # Check if file or directory existence
-    full_path.parent.mkdir(parents=True, exist_ok=dir_exist_ok)
-    if full_path.exists() and not file_exist_ok:
+    # Check if file or directory existence. When an existing directory is
+    # acceptable, a single stat answers the common case; mkdir would try to
+    # create it and then stat it again after the failure.
+    parent = full_path.parent
+    if not (dir_exist_ok and os.path.isdir(parent)):
+        parent.mkdir(parents=True, exist_ok=dir_exist_ok)
+    if not file_exist_ok and os.path.exists(full_path):
         raise FileExistsError(
             f"File {full_path} already exists and file_exist_ok is False."
         )
@@ -1095,6 +1524,56 @@ class CreatePathParams(Params):
 
 # --- JSON and XML Conversion ---
 
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
+# orjson turns integers outside the 64-bit range into floats, so text
+# with long digit runs is left to the stdlib parser.
+_LONG_DIGIT_RUN_RE = re.compile(r"[0-9]{19}")
+
+
+def _json_loads(s: str, /) -> Any:
+    """Parse JSON with orjson when available, else with json.loads.
+
+    Anything orjson rejects (NaN, lone surrogates, ...) or might read
+    lossily is retried with json.loads, so results and errors match the
+    standard library.
+    """
+    if _orjson is not None and not _LONG_DIGIT_RUN_RE.search(s):
+        try:
+            return _orjson.loads(s)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
+_XML_ESCAPE_TABLE = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "'": "&apos;",
+    }
+)
+_XML_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
+_STR_TYPE_SET = frozenset({str})
+_XML_PLAIN_TYPES = frozenset({int, float, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=256)
+def _xml_flat_template(root_name: str, keys: tuple[str, ...], /) -> str:
+    """Build a str.format template for a flat dict with the given keys."""
+    # Literal braces in tag names must survive str.format
+    root, *tags = (
+        name.replace("{", "{{").replace("}", "}}")
+        for name in (root_name, *keys)
+    )
+    fields = "".join(f"<{tag}>{{}}</{tag}>" for tag in tags)
+    return f"<{root}>{fields}</{root}>"
+
 
 def to_xml(
     obj: dict | list | str | int | float | bool | None,
@@ -1123,33 +1602,54 @@ def to_xml(
         '<data><a>1</a><b><c>hello</c><d>10</d><d>20</d></b></data>'
     """
 
-    def _convert(value: Any, tag_name: str) -> str:
-        # If value is a dict, recursively convert its keys
+    # If top-level obj is not a dict, wrap it in one
+    if not isinstance(obj, dict):
+        obj = {root_name: obj}
+    # Flat dicts of primitives with string keys, such as tool schemas that
+    # are serialised over and over, fill a cached per-shape template
+    elif (
+        obj
+        and _SCALAR_TYPES.issuperset(map(type, obj.values()))
+        and set(map(type, obj)) == _STR_TYPE_SET
+    ):
+        texts = ["" if v is None else str(v) for v in obj.values()]
+        if _XML_NEEDS_ESCAPE("".join(texts)):
+            texts = [
+                t.translate(_XML_ESCAPE_TABLE) if _XML_NEEDS_ESCAPE(t) else t
+                for t in texts
+            ]
+        return _xml_flat_template(str(root_name), tuple(obj)).format(*texts)
+
+    # Walk the structure with an explicit stack, appending every fragment to
+    # one buffer. Entries are (value, tag) pairs, or a closing tag string
+    # that is emitted once all of a dict's children have been written.
+    out: list[str] = []
+    append = out.append
+    stack: list[tuple[Any, str] | str] = [(obj, root_name)]
+    while stack:
+        entry = stack.pop()
+        if type(entry) is str:
+            append(entry)
+            continue
+        value, tag_name = entry
+        # A dict becomes a tag wrapping its converted keys
         if isinstance(value, dict):
-            inner = "".join(_convert(v, k) for k, v in value.items())
-            return f"<{tag_name}>{inner}</{tag_name}>"
-        # If value is a list, repeat the same tag for each element
+            append(f"<{tag_name}>")
+            stack.append(f"</{tag_name}>")
+            stack.extend((v, k) for k, v in reversed(value.items()))
+        # A list repeats the same tag for each element
         elif isinstance(value, list):
-            return "".join(_convert(item, tag_name) for item in value)
-        # If value is a primitive, convert to string and place inside tag
+            stack.extend((item, tag_name) for item in reversed(value))
+        # A primitive becomes the text content of the tag
         else:
             text = "" if value is None else str(value)
-            # Escape special XML characters if needed (minimal)
-            text = (
-                text.replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&apos;")
-            )
-            return f"<{tag_name}>{text}</{tag_name}>"
-
-    # If top-level obj is not a dict, wrap it in one
-    if not isinstance(obj, dict):
-        obj = {root_name: obj}
+            # Escape special XML characters in one pass, and only if present;
+            # numbers and booleans never contain any
+            if type(value) not in _XML_PLAIN_TYPES and _XML_NEEDS_ESCAPE(text):
+                text = text.translate(_XML_ESCAPE_TABLE)
+            append(f"<{tag_name}>{text}</{tag_name}>")
 
-    inner_xml = "".join(_convert(v, k) for k, v in obj.items())
-    return f"<{root_name}>{inner_xml}</{root_name}>"
+    return "".join(out)
 
 
 def fuzzy_parse_json(
@@ -1178,17 +1678,20 @@ def fuzzy_parse_json(
 
     # 1. Direct attempt
     with contextlib.suppress(Exception):
-        return json.loads(str_to_parse)
+        return _json_loads(str_to_parse)
 
-    # 2. Try cleaning: replace single quotes with double and normalize
-    cleaned = _clean_json_string(str_to_parse.replace("'", '"'))
+    # 2. Try cleaning: replace single quotes with double and normalize.
+    # Only reached when the direct parse failed.
+    cleaned = _clean_json_string(
+        str_to_parse.replace("'", '"') if "'" in str_to_parse else str_to_parse
+    )
     with contextlib.suppress(Exception):
-        return json.loads(cleaned)
+        return _json_loads(cleaned)
 
     # 3. Try fixing brackets
     fixed = fix_json_string(cleaned)
     with contextlib.suppress(Exception):
-        return json.loads(fixed)
+        return _json_loads(fixed)
 
     # If all attempts fail
     raise ValueError("Invalid JSON string")
@@ -1201,19 +1704,31 @@ def _check_valid_str(str_to_parse: str, /):
         raise ValueError("Input string is empty")
 
 
+# '(?<!\\)'" means a single quote not preceded by a backslash
+_UNESCAPED_SINGLE_QUOTE_RE = re.compile(r"(?<!\\)'")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+# Finds patterns like { key: value } so they can become {"key": value}
+_UNQUOTED_KEY_RE = re.compile(r'([{,])\s*([^"\s]+)\s*:')
+
+
 def _clean_json_string(s: str) -> str:
     """Basic normalization: replace unescaped single quotes, trim spaces, ensure keys are quoted."""
+    # Each substitution is skipped when a plain substring test shows it
+    # cannot match, which is cheaper than letting the regex scan.
     # Replace unescaped single quotes with double quotes
-    # '(?<!\\)'" means a single quote not preceded by a backslash
-    s = re.sub(r"(?<!\\)'", '"', s)
+    if "'" in s:
+        s = _UNESCAPED_SINGLE_QUOTE_RE.sub('"', s)
     # Collapse multiple whitespaces
-    s = re.sub(r"\s+", " ", s)
+    s = _WHITESPACE_RUN_RE.sub(" ", s)
     # Ensure keys are quoted
-    # This attempts to find patterns like { key: value } and turn them into {"key": value}
-    s = re.sub(r'([{,])\s*([^"\s]+)\s*:', r'\1"\2":', s)
+    if ":" in s:
+        s = _UNQUOTED_KEY_RE.sub(r'\1"\2":', s)
     return s.strip()
 
 
+_JSON_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+
+
 def fix_json_string(str_to_parse: str, /) -> str:
     """Try to fix JSON string by ensuring brackets are matched properly."""
     if not str_to_parse:
@@ -1223,8 +1738,14 @@ def fix_json_string(str_to_parse: str, /) -> str:
     open_brackets = []
     pos = 0
     length = len(str_to_parse)
+    # Jump between structural characters instead of stepping one by one
+    find_next = _JSON_STRUCTURAL_RE.search
 
     while pos < length:
+        match = find_next(str_to_parse, pos)
+        if match is None:
+            break
+        pos = match.start()
         char = str_to_parse[pos]
 
         if char == "\\":
@@ -1233,20 +1754,23 @@ def fix_json_string(str_to_parse: str, /) -> str:
 
         if char == '"':
             pos += 1
-            # skip string content
-            while pos < length:
-                if str_to_parse[pos] == "\\":
-                    pos += 2
-                    continue
-                if str_to_parse[pos] == '"':
-                    pos += 1
+            # skip string content: jump to the next quote, stepping over any
+            # backslash escapes that come before it
+            while True:
+                quote = str_to_parse.find('"', pos)
+                if quote == -1:
+                    pos = length
+                    break
+                backslash = str_to_parse.find("\\", pos, quote)
+                if backslash == -1:
+                    pos = quote + 1
                     break
-                pos += 1
+                pos = backslash + 2
             continue
 
         if char in brackets:
             open_brackets.append(brackets[char])
-        elif char in brackets.values():
+        else:
             if not open_brackets:
                 # Extra closing bracket
                 # Better to raise error than guess
@@ -1265,7 +1789,17 @@ def fix_json_string(str_to_parse: str, /) -> str:
     return str_to_parse
 
 
+# Patterns are matched at an offset into the document rather than against
+# a slice of the remainder, so each step does not copy the rest of the input.
+_XML_OPENING_TAG_RE = re.compile(r'<(\w+)((?:\s+\w+="[^"]*")*)\s*/?>')
+_XML_CLOSING_TAG_RE = re.compile(r"</(\w+)>")
+_XML_ATTRIBUTE_RE = re.compile(r'(\w+)="([^"]*)"')
+_XML_WHITESPACE_RE = re.compile(r"\s*")
+
+
 class XMLParser:
+    __slots__ = ("xml_string", "index")
+
     def __init__(self, xml_string: str):
         self.xml_string = xml_string.strip()
         self.index = 0
@@ -1319,41 +1853,33 @@ class XMLParser:
 
     def _parse_opening_tag(self) -> tuple[str, dict[str, str]]:
         """Parse an opening XML tag and its attributes."""
-        match = re.match(
-            r'<(\w+)((?:\s+\w+="[^"]*")*)\s*/?>',
-            self.xml_string[self.index :],  # noqa
-        )
+        match = _XML_OPENING_TAG_RE.match(self.xml_string, self.index)
         if not match:
             raise ValueError("Invalid opening tag")
-        self.index += match.end()
+        self.index = match.end()
         tag = match.group(1)
-        attributes = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2)))
+        attributes = dict(_XML_ATTRIBUTE_RE.findall(match.group(2)))
         return tag, attributes
 
     def _parse_closing_tag(self) -> str:
         """Parse a closing XML tag."""
-        match = re.match(r"</(\w+)>", self.xml_string[self.index :])  # noqa
+        match = _XML_CLOSING_TAG_RE.match(self.xml_string, self.index)
         if not match:
             raise ValueError("Invalid closing tag")
-        self.index += match.end()
+        self.index = match.end()
         return match.group(1)
 
     def _parse_text(self) -> str:
         """Parse text content between XML tags."""
         start = self.index
-        while (
-            self.index < len(self.xml_string)
-            and self.xml_string[self.index] != "<"
-        ):
-            self.index += 1
+        end = self.xml_string.find("<", start)
+        self.index = len(self.xml_string) if end == -1 else end
         return self.xml_string[start : self.index]  # noqa
 
     def _skip_whitespace(self) -> None:
         """Skip any whitespace characters at the current parsing position."""
-        p_ = len(self.xml_string[self.index :])  # noqa
-        m_ = len(self.xml_string[self.index :].lstrip())  # noqa
-
-        self.index += p_ - m_
+        match = _XML_WHITESPACE_RE.match(self.xml_string, self.index)
+        self.index = match.end()
 
 
 def xml_to_dict(
@@ -1392,6 +1918,8 @@ def xml_to_dict(
 
 
 def dict_to_xml(data: dict, /, root_tag: str = "root") -> str:
+    # Imported here: nothing else in lionagi loads ElementTree at startup
+    import xml.etree.ElementTree as ET
 
     root = ET.Element(root_tag)
 
@@ -1456,7 +1984,7 @@ def to_dict(
 
     try:
         if recursive:
-            input_ = recursive_to_dict(
+            converted = recursive_to_dict(
                 input_,
                 use_model_dump=use_model_dump,
                 fuzzy_parse=fuzzy_parse,
@@ -1467,6 +1995,11 @@ def to_dict(
                 use_enum_values=use_enum_values,
                 **kwargs,
             )
+            # A dict input comes back rebuilt unless the depth was 0, so
+            # it is already a fresh dict and needs no second copy
+            if type(input_) is dict and converted is not input_:
+                return converted
+            input_ = converted
 
         return _to_dict(
             input_,
@@ -1515,6 +2048,10 @@ def recursive_to_dict(
     )
 
 
+# Work items for _recur_to_dict's explicit stack
+_VISIT, _BUILD_DICT, _BUILD_SEQ, _GUARD = range(4)
+
+
 def _recur_to_dict(
     input_: Any,
     /,
@@ -1524,89 +2061,113 @@ def _recur_to_dict(
     recursive_custom_types: bool = False,
     **kwargs: Any,
 ) -> Any:
+    """Convert nested structures to dicts without recursing in Python.
+
+    Work items live on an explicit stack and finished values on a result
+    stack. A container is visited by scheduling a build step followed by
+    visits of its children; the build step collects the children's results.
+    Strings, enum classes and custom objects are converted once and their
+    converted value is visited under a guard: if anything inside fails, the
+    guard discards the partial work and yields the original value instead.
+    """
+    results: list[Any] = []
+    stack: list[tuple[int, Any, int, bool | None]] = [
+        (_VISIT, input_, current_depth, recursive_custom_types)
+    ]
+    # Hoisted out of the loop: bound methods and the conversion options
+    emit, push, extend, pop = (
+        results.append,
+        stack.append,
+        stack.extend,
+        stack.pop,
+    )
+    convert = partial(_to_dict, **kwargs) if kwargs else _to_dict
 
-    if current_depth >= max_recursive_depth:
-        return input_
-
-    if isinstance(input_, str):
+    while stack:
+        # Every work item is a 4-tuple: (op, value, depth_or_start, custom)
+        op, value, pos, custom = pop()
         try:
-            # Attempt to parse the string
-            parsed = _to_dict(input_, **kwargs)
-            # Recursively process the parsed result
-            return _recur_to_dict(
-                parsed,
-                max_recursive_depth=max_recursive_depth,
-                current_depth=current_depth + 1,
-                recursive_custom_types=recursive_custom_types,
-                **kwargs,
-            )
-        except Exception:
-            # Return the original string if parsing fails
-            return input_
+            if op == _VISIT:
+                depth = pos
+                if depth >= max_recursive_depth:
+                    emit(value)
+                    continue
 
-    elif isinstance(input_, dict):
-        # Recursively process dictionary values
-        return {
-            key: _recur_to_dict(
-                value,
-                max_recursive_depth=max_recursive_depth,
-                current_depth=current_depth + 1,
-                recursive_custom_types=recursive_custom_types,
-                **kwargs,
-            )
-            for key, value in input_.items()
-        }
+                if isinstance(value, str):
+                    convertible = True
+                elif isinstance(value, dict):
+                    push((_BUILD_DICT, list(value), len(results), None))
+                    extend(
+                        (_VISIT, v, depth + 1, custom)
+                        for v in reversed(value.values())
+                    )
+                    continue
+                elif isinstance(value, (list, tuple, set)):
+                    push((_BUILD_SEQ, type(value), len(results), None))
+                    extend(
+                        (_VISIT, v, depth + 1, custom)
+                        for v in reversed(list(value))
+                    )
+                    continue
+                elif isinstance(value, type) and issubclass(value, Enum):
+                    # Members of an enum are not converted as custom types
+                    convertible, custom = True, False
+                else:
+                    convertible = custom
 
-    elif isinstance(input_, (list, tuple, set)):
-        # Recursively process list or tuple elements
-        processed = [
-            _recur_to_dict(
-                element,
-                max_recursive_depth=max_recursive_depth,
-                current_depth=current_depth + 1,
-                recursive_custom_types=recursive_custom_types,
-                **kwargs,
-            )
-            for element in input_
-        ]
-        return type(input_)(processed)
+                if not convertible:
+                    # Return the input as is for other data types
+                    emit(value)
+                    continue
+                try:
+                    converted = convert(value)
+                except Exception:
+                    # Return the original value if conversion fails
+                    emit(value)
+                    continue
+                push((_GUARD, value, len(results), None))
+                push((_VISIT, converted, depth + 1, custom))
 
-    elif isinstance(input_, type) and issubclass(input_, Enum):
-        try:
-            obj_dict = _to_dict(input_, **kwargs)
-            return _recur_to_dict(
-                obj_dict,
-                max_recursive_depth=max_recursive_depth,
-                current_depth=current_depth + 1,
-                **kwargs,
-            )
-        except Exception:
-            return input_
+            elif op == _BUILD_DICT:
+                # value holds the keys, pos where the child results start
+                values = results[pos:]
+                del results[pos:]
+                emit(dict(zip(value, values)))
 
-    elif recursive_custom_types:
-        # Process custom classes if enabled
-        try:
-            obj_dict = _to_dict(input_, **kwargs)
-            return _recur_to_dict(
-                obj_dict,
-                max_recursive_depth=max_recursive_depth,
-                current_depth=current_depth + 1,
-                recursive_custom_types=recursive_custom_types,
-                **kwargs,
-            )
-        except Exception:
-            return input_
+            elif op == _BUILD_SEQ:
+                # value holds the container type
+                processed = results[pos:]
+                del results[pos:]
+                emit(value(processed))
 
-    else:
-        # Return the input as is for other data types
-        return input_
+            # A _GUARD reached normally just lets its child's result stand
+
+        except Exception:
+            # Unwind to the innermost guard and fall back to its original
+            # value; with no guard left, the error reaches the caller.
+            while stack and stack[-1][0] != _GUARD:
+                pop()
+            if not stack:
+                raise
+            _, original, start, _ = pop()
+            del results[start:]
+            emit(original)
+
+    return results[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _enum_members_dict(enum_cls: type[Enum], use_enum_values: bool, /):
+    # Enum members are fixed once the class exists, so the mapping can be
+    # computed once per (class, flag); callers must copy before handing out.
+    members = enum_cls.__members__
+    if use_enum_values:
+        return {key: value.value for key, value in members.items()}
+    return dict(members)
 
 
 def _enum_to_dict(input_, /, use_enum_values: bool = True):
-    dict_ = dict(input_.__members__).copy()
-    if use_enum_values:
-        return {key: value.value for key, value in dict_.items()}
-    return dict_
+    return dict(_enum_members_dict(input_, bool(use_enum_values)))
 
 
 def _str_to_dict(
@@ -1631,7 +2192,7 @@ def _str_to_dict(
         elif fuzzy_parse:
             parser = fuzzy_parse_json
         else:
-            parser = json.loads
+            parser = _json_loads if not kwargs else json.loads
 
     return parser(input_, **kwargs)
 
@@ -1663,7 +2224,7 @@ def _model_to_dict(input_: Any, /, use_model_dump=True, **kwargs):
     for method in methods:
         if hasattr(input_, method):
             result = getattr(input_, method)(**kwargs)
-            return json.loads(result) if isinstance(result, str) else result
+            return _json_loads(result) if isinstance(result, str) else result
 
     if hasattr(input_, "__dict__"):
         return input_.__dict__
@@ -1696,6 +2257,29 @@ def _to_dict(
     **kwargs: Any,
 ) -> dict[str, Any]:
 
+    # Exact-type fast paths for the common cases; these skip the ABC
+    # isinstance checks below, which are comparatively expensive.
+    input_type = type(input_)
+    if input_type is dict:
+        return dict(input_)
+
+    if input_type is str:
+        return _str_to_dict(
+            input_,
+            fuzzy_parse=fuzzy_parse,
+            str_type=str_type,
+            parser=parser,
+            remove_root=remove_root,
+            root_tag=root_tag,
+            **kwargs,
+        )
+
+    if input_type is list or input_type is tuple:
+        return _iterable_to_dict(input_)
+
+    if input_ is None:
+        return _na_to_dict(input_)
+
     if isinstance(input_, set):
         return _set_to_dict(input_)
 
@@ -1728,8 +2312,19 @@ def _to_dict(
     return dict(input_)
 
 
-# Precompile the regex for extracting JSON code blocks
-_JSON_BLOCK_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+def _extract_json_blocks(input_str: str, /) -> list[str]:
+    """Return the stripped contents of every ```json fenced block."""
+    blocks = []
+    find = input_str.find
+    pos = 0
+    while (start := find("```json", pos)) != -1:
+        start += 7
+        end = find("```", start)
+        if end == -1:
+            break
+        blocks.append(input_str[start:end].strip())
+        pos = end + 3
+    return blocks
 
 
 def to_json(
@@ -1762,12 +2357,12 @@ def to_json(
     try:
         if fuzzy_parse:
             return fuzzy_parse_json(input_str)
-        return json.loads(input_str)
+        return _json_loads(input_str)
     except Exception:
         pass
 
     # 2. Attempt extracting JSON blocks from markdown
-    matches = _JSON_BLOCK_PATTERN.findall(input_str)
+    matches = _extract_json_blocks(input_str)
     if not matches:
         return []
 
@@ -1775,14 +2370,16 @@ def to_json(
     if len(matches) == 1:
         data_str = matches[0]
         return (
-            fuzzy_parse_json(data_str) if fuzzy_parse else json.loads(data_str)
+            fuzzy_parse_json(data_str)
+            if fuzzy_parse
+            else _json_loads(data_str)
         )
 
     # Multiple matches
     if fuzzy_parse:
         return [fuzzy_parse_json(m) for m in matches]
     else:
-        return [json.loads(m) for m in matches]
+        return [_json_loads(m) for m in matches]
 
 
 def get_bins(input_: list[str], upper: int) -> list[list[int]]:
@@ -1823,6 +2420,8 @@ class Throttle:
         period: The minimum time period (in seconds) between successive calls.
     """
 
+    __slots__ = ("period", "last_called")
+
     def __init__(self, period: float) -> None:
         """
         Initialize a new instance of Throttle.
@@ -2381,7 +2980,7 @@ def run_package_manager_command(
             )
         except subprocess.CalledProcessError:
             # If uv fails, fall back to pip
-            print("uv command failed, falling back to pip...")
+            logger.warning("uv command failed, falling back to pip...")
 
     # Fall back to pip
     return subprocess.run(
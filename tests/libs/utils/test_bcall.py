@@ -2,7 +2,8 @@ import asyncio
 import unittest
 from unittest.mock import AsyncMock, patch
 
-from lionagi.utils import bcall
+from lionagi._errors import ExecutionError
+from lionagi.utils import CircuitBreaker, bcall
 
 
 async def async_func(x: int) -> int:
@@ -102,6 +103,125 @@ class TestBCallFunction(unittest.IsolatedAsyncioTestCase):
             batches.append(batch)
         self.assertEqual(batches, [[11, 12], [13, 14], [15]])
 
+    async def test_bcall_circuit_breaker_short_circuits_batches(self):
+        calls = []
+
+        async def always_fails(x: int) -> int:
+            calls.append(x)
+            raise ValueError("service down")
+
+        breaker = CircuitBreaker(threshold=0.5, min_samples=2, window=4)
+        batches = []
+        async for batch in bcall(
+            [1, 2, 3, 4, 5, 6],
+            always_fails,
+            batch_size=2,
+            retry_default=-1,
+            circuit_breaker=breaker,
+        ):
+            batches.append(batch)
+        self.assertEqual(batches, [[-1, -1], [-1, -1], [-1, -1]])
+        self.assertEqual(sorted(calls), [1, 2])
+        self.assertTrue(breaker.is_open)
+
+    async def test_bcall_open_breaker_keeps_batch_shape(self):
+        breaker = CircuitBreaker(threshold=0.5, min_samples=1, window=1)
+        breaker.record(False)
+
+        batches = []
+        async for batch in bcall(
+            [1, 2, 3],
+            async_func,
+            batch_size=2,
+            retry_default=-1,
+            retry_timing=True,
+            circuit_breaker=breaker,
+        ):
+            batches.append(batch)
+        self.assertEqual([len(b) for b in batches], [2, 1])
+        for batch in batches:
+            for result, duration in batch:
+                self.assertEqual(result, -1)
+                self.assertIsInstance(duration, float)
+
+        batches = []
+        async for batch in bcall(
+            [1, 2, 3],
+            async_func,
+            batch_size=2,
+            retry_default=None,
+            dropna=True,
+            circuit_breaker=breaker,
+        ):
+            batches.append(batch)
+        self.assertEqual(batches, [[], []])
+
+    async def test_bcall_circuit_breaker_without_default_raises(self):
+        breaker = CircuitBreaker(threshold=0.5, min_samples=1, window=1)
+        breaker.record(False)
+        with self.assertRaises(ExecutionError):
+            async for _ in bcall(
+                [1, 2], async_func, batch_size=1, circuit_breaker=breaker
+            ):
+                pass
+
+    async def test_bcall_dedup_shares_identical_calls(self):
+        calls = []
+
+        async def tracked(x: int) -> int:
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        batches = []
+        async for batch in bcall(
+            [1, 1, 2, 1, 2, 3], tracked, batch_size=3, dedup=True
+        ):
+            batches.append(batch)
+        self.assertEqual(batches, [[2, 2, 4], [2, 4, 6]])
+        self.assertEqual(sorted(calls), [1, 2, 3])
+
+    async def test_bcall_dedup_sync_distinguishes_types(self):
+        calls = []
+
+        def tracked(x):
+            calls.append(x)
+            return repr(x)
+
+        batches = []
+        async for batch in bcall(
+            [1, True, 1, 1.0], tracked, batch_size=4, dedup=True
+        ):
+            batches.append(batch)
+        self.assertEqual(batches, [["1", "True", "1", "1.0"]])
+        self.assertEqual(len(calls), 3)
+
+    async def test_bcall_streams_generator_input(self):
+        pulled = []
+
+        def gen():
+            for x in range(1, 6):
+                pulled.append(x)
+                yield x
+
+        batches = []
+        async for batch in bcall(gen(), sync_func, batch_size=2):
+            # Items are pulled one batch at a time, not all up front
+            self.assertEqual(len(pulled), min(2 * (len(batches) + 1), 5))
+            batches.append(batch)
+        self.assertEqual(batches, [[2, 4], [6, 8], [10]])
+        self.assertEqual(pulled, [1, 2, 3, 4, 5])
+
+    def test_circuit_breaker_window(self):
+        breaker = CircuitBreaker(threshold=0.5, min_samples=2, window=2)
+        breaker.record(False)
+        self.assertFalse(breaker.is_open)
+        breaker.record(False)
+        self.assertTrue(breaker.is_open)
+        breaker.record(True)
+        breaker.record(True)
+        self.assertFalse(breaker.is_open)
+
 
 if __name__ == "__main__":
     unittest.main()
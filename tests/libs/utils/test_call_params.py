@@ -0,0 +1,21 @@
+from lionagi.utils import ALCallParams, LCallParams
+
+
+def test_call_params_routes_undeclared_keys_to_kwargs():
+    data = {"func": str, "flatten": True, "foo": 1}
+    params = LCallParams(**data)
+    assert params.func is str
+    assert params.flatten is True
+    assert params.args == []
+    assert params.kwargs == {"foo": 1}
+    assert data == {"func": str, "flatten": True, "foo": 1}
+
+
+def test_call_params_merges_explicit_kwargs():
+    params = LCallParams(kwargs={"a": 1}, b=2)
+    assert params.kwargs == {"a": 1, "b": 2}
+
+
+async def test_alcall_params_call():
+    params = ALCallParams(func=lambda x: x * 2)
+    assert await params([1, 2]) == [2, 4]
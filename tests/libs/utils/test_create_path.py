@@ -0,0 +1,53 @@
+import pytest
+
+from lionagi.utils import create_path
+
+
+def test_create_path_makes_missing_directories(tmp_path):
+    path = create_path(tmp_path / "a" / "b", "file.txt")
+    assert path == tmp_path / "a" / "b" / "file.txt"
+    assert path.parent.is_dir()
+
+
+def test_create_path_reuses_existing_directory(tmp_path):
+    first = create_path(tmp_path, "one", extension="json")
+    second = create_path(tmp_path, "two.json")
+    assert first.parent == second.parent == tmp_path
+
+
+def test_create_path_existing_directory_not_ok(tmp_path):
+    with pytest.raises(FileExistsError):
+        create_path(tmp_path, "file.txt", dir_exist_ok=False)
+
+
+def test_create_path_existing_file(tmp_path):
+    (tmp_path / "file.txt").write_text("x")
+    with pytest.raises(FileExistsError):
+        create_path(tmp_path, "file.txt")
+    assert create_path(tmp_path, "file.txt", file_exist_ok=True).exists()
+
+
+def test_create_path_random_suffix(tmp_path):
+    path = create_path(tmp_path, "file.txt", random_hash_digits=5)
+    name, suffix = path.stem.rsplit("-", 1)
+    assert name == "file"
+    assert len(suffix) == 5
+    int(suffix, 16)
+
+
+def test_create_path_timestamp(tmp_path):
+    path = create_path(tmp_path, "file.txt", timestamp=True)
+    name, ts = path.stem.rsplit("_", 1)
+    assert name == "file"
+    assert len(ts) == 14 and ts.isdigit()
+
+    path = create_path(
+        tmp_path,
+        "log",
+        timestamp=True,
+        time_prefix=True,
+        timestamp_format="%f",
+    )
+    ts, name = path.name.split("_", 1)
+    assert name == "log"
+    assert len(ts) == 6 and ts.isdigit()
@@ -0,0 +1,48 @@
+import functools
+
+from lionagi.utils import is_coro_func
+
+
+async def async_func():
+    pass
+
+
+def sync_func():
+    pass
+
+
+def test_is_coro_func_plain_functions():
+    assert is_coro_func(async_func) is True
+    assert is_coro_func(sync_func) is False
+
+
+def test_is_coro_func_leaves_functions_untouched():
+    @functools.wraps(sync_func)
+    def decorated():
+        pass
+
+    before = dict(decorated.__dict__)
+    assert is_coro_func(decorated) is False
+    assert decorated.__dict__ == before
+
+
+def test_is_coro_func_marked_function_untouched():
+    import asyncio
+
+    async def coro():
+        pass
+
+    def marked():
+        return coro()
+
+    marked._is_coroutine = asyncio.coroutines._is_coroutine
+    before = dict(marked.__dict__)
+    assert is_coro_func(marked) is True
+    assert marked.__dict__ == before
+
+    # A plain sync wrapper copies no cached answer from what it wraps
+    @functools.wraps(coro)
+    def sync_wrapper():
+        return None
+
+    assert is_coro_func(sync_wrapper) is False
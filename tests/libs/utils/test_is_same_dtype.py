@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock
+
+from lionagi.utils import is_same_dtype
+
+
+class A:
+    pass
+
+
+class B(A):
+    pass
+
+
+def test_is_same_dtype_subclasses():
+    assert is_same_dtype([A(), B()], A)
+    assert not is_same_dtype([A(), 1], A)
+    assert is_same_dtype([1, 2, 3])
+
+
+def test_is_same_dtype_spec_mock_matches_like_isinstance():
+    mock = MagicMock(spec=A)
+    assert is_same_dtype([mock], A)
+    assert is_same_dtype([A(), mock], A)
+    assert is_same_dtype({"a": mock}, A)
+    assert not is_same_dtype([mock, 1], A)
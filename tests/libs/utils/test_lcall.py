@@ -3,7 +3,7 @@ import unittest
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
-from lionagi.utils import alcall
+from lionagi.utils import alcall, lcall
 
 
 async def mock_func(x: int, add: int = 0) -> int:
@@ -81,6 +81,88 @@ class TestLCallFunction(unittest.IsolatedAsyncioTestCase):
             mock_sleep.assert_any_call(0.1)
             mock_sleep.assert_any_call(0.2)
 
+    async def test_lcall_preserves_order(self):
+        async def func(x: int) -> int:
+            await asyncio.sleep(0.01 * (5 - x))
+            return x
+
+        inputs = [1, 2, 3, 4]
+        self.assertEqual(await alcall(inputs, func), inputs)
+        self.assertEqual(
+            await alcall(inputs, func, throttle_period=0.01), inputs
+        )
+
+    async def test_lcall_max_concurrent_bounds_in_flight(self):
+        in_flight = peak = 0
+
+        async def func(x: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return x
+
+        inputs = list(range(10))
+        results = await alcall(inputs, func, max_concurrent=3)
+        self.assertEqual(results, inputs)
+        self.assertEqual(peak, 3)
+
+    async def test_lcall_sync_timeout_uses_bounded_pool(self):
+        import threading
+        import time
+
+        threads = set()
+
+        def func(x: int) -> int:
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return x
+
+        inputs = list(range(8))
+        results = await alcall(inputs, func, retry_timeout=1, max_concurrent=2)
+        self.assertEqual(results, inputs)
+        self.assertLessEqual(len(threads), 2)
+
+    def test_sync_lcall_interrupted_returns_partial(self):
+        def func(x: int, add: int = 0) -> int:
+            if x == 3:
+                raise InterruptedError
+            return x + add
+
+        self.assertEqual(lcall([1, 2, 3, 4], func), [1, 2])
+        self.assertEqual(lcall([1, 2, 3, 4], func, add=1), [2, 3])
+
+    async def test_lcall_sync_timeout_sees_context(self):
+        import contextvars
+
+        var = contextvars.ContextVar("var", default=None)
+        var.set("caller")
+
+        def func(x: int) -> Any:
+            seen = var.get()
+            var.set(x)
+            return seen
+
+        results = await alcall([1, 2, 3], func, retry_timeout=1)
+        self.assertEqual(results, ["caller"] * 3)
+        self.assertEqual(var.get(), "caller")
+
+    async def test_lcall_failure_cancels_pending(self):
+        finished = []
+
+        async def func(x: int) -> int:
+            if x == 1:
+                raise ValueError("mock error")
+            await asyncio.sleep(0.1)
+            finished.append(x)
+            return x
+
+        with self.assertRaises(ValueError):
+            await alcall([1, 2, 3], func)
+        await asyncio.sleep(0.15)
+        self.assertEqual(finished, [])
+
 
 if __name__ == "__main__":
     unittest.main()
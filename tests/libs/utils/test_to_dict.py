@@ -168,3 +168,29 @@ def test_to_dict_performance():
         end_time - start_time
     ) < 0.1  # Assuming it should take less than 0.1 seconds
     assert result == large_dict
+
+
+def test_to_dict_with_enum_class():
+    from enum import Enum
+
+    class Color(Enum):
+        RED = 1
+        GREEN = 2
+
+    first = to_dict(Color, use_enum_values=True)
+    assert first == {"RED": 1, "GREEN": 2}
+    first["BLUE"] = 3
+    assert to_dict(Color, use_enum_values=True) == {"RED": 1, "GREEN": 2}
+    assert to_dict(Color) == {"RED": Color.RED, "GREEN": Color.GREEN}
+
+
+def test_to_dict_returns_new_dict():
+    data = {"a": {"b": 1}}
+    for kwargs in (
+        {},
+        {"recursive": True},
+        {"recursive": True, "max_recursive_depth": 0},
+    ):
+        result = to_dict(data, **kwargs)
+        assert result == data
+        assert result is not data
@@ -0,0 +1,24 @@
+import math
+
+from lionagi.utils import to_json
+
+
+def test_to_json_direct():
+    assert to_json('{"a": 1}') == {"a": 1}
+
+
+def test_to_json_markdown_blocks():
+    text = 'intro\n```json\n  {"a": 1}\n```\nmid\n```json{"b": 2}  ```'
+    assert to_json(text) == [{"a": 1}, {"b": 2}]
+    assert to_json(["see:", "```json", '{"c": 3}', "```"]) == {"c": 3}
+
+
+def test_to_json_unterminated_or_missing_block():
+    assert to_json("no json here") == []
+    assert to_json('```json\n{"a": 1}') == []
+
+
+def test_to_json_matches_stdlib_edge_cases():
+    big = 2**70
+    assert to_json(f'{{"n": {big}, "m": -{big}}}') == {"n": big, "m": -big}
+    assert math.isnan(to_json('{"x": NaN}')["x"])
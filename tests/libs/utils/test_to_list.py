@@ -212,6 +212,13 @@ def test_deeply_nested_structure():
     assert to_list(deeply_nested, flatten=True) == [1, 2, 3, 4, 5, 6]
 
 
+def test_flatten_beyond_recursion_limit():
+    nested = [0]
+    for i in range(1, 5000):
+        nested = [nested, i]
+    assert to_list(nested, flatten=True) == list(range(5000))
+
+
 def test_input_with_all_none():
     assert to_list([None, None, None], dropna=True) == []
 
@@ -323,3 +330,24 @@ def test_to_list_with_custom_flatten():
 
 
 # File: tests/test_to_list.py
+
+
+def test_scalar_list_returns_copy():
+    data = [1, "a", 2.0, None, True]
+    result = to_list(data)
+    assert result == data
+    assert result is not data
+    assert to_list(data, dropna=True) == [1, "a", 2.0, True]
+
+
+def test_list_of_classes():
+    from enum import Enum
+
+    class Color(Enum):
+        RED = 1
+
+    assert to_list([TestModel, 1]) == [TestModel, 1]
+    assert to_list([dict]) == [dict]
+    assert to_list([[str, 1]]) == [[str, 1]]
+    assert to_list([[str, 1], TestModel], flatten=True) == [str, 1, TestModel]
+    assert to_list([Color], flatten=True) == [Color.RED]
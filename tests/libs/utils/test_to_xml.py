@@ -0,0 +1,48 @@
+import pytest
+
+from lionagi.utils import to_xml
+
+
+def test_to_xml_nested():
+    data = {"a": 1, "b": {"c": "hello", "d": [10, 20]}}
+    assert (
+        to_xml(data, root_name="data")
+        == "<data><a>1</a><b><c>hello</c><d>10</d><d>20</d></b></data>"
+    )
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("plain", "plain"),
+        ("a<b>c", "a&lt;b&gt;c"),
+        ("x & y", "x &amp; y"),
+        ("\"q\" 'a'", "&quot;q&quot; &apos;a&apos;"),
+        ("&amp;", "&amp;amp;"),
+        (None, ""),
+    ],
+)
+def test_to_xml_escaping(value, expected):
+    assert to_xml({"v": value}) == f"<root><v>{expected}</v></root>"
+
+
+def test_to_xml_non_dict_root():
+    assert to_xml([1, 2], root_name="r") == "<r><r>1</r><r>2</r></r>"
+
+
+def test_to_xml_deep_nesting():
+    data = "leaf"
+    for _ in range(3000):
+        data = {"n": data}
+    xml = to_xml(data)
+    assert xml.startswith("<root><n><n>")
+    assert xml.count("<n>") == 3000
+    assert "<n>leaf</n>" in xml
+
+
+def test_to_xml_flat_dict_reuses_shape():
+    first = to_xml({"name": "a<b", "n": 1, "ok": None}, root_name="t")
+    second = to_xml({"name": "c", "n": 2.5, "ok": True}, root_name="t")
+    assert first == "<t><name>a&lt;b</name><n>1</n><ok></ok></t>"
+    assert second == "<t><name>c</name><n>2.5</n><ok>True</ok></t>"
+    assert to_xml({"{x}": "v"}, root_name="r{}") == "<r{}><{x}>v</{x}></r{}>"
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lionagi.operatives.instruct.instruct import Instruct, InstructResponse
+from lionagi.operatives.strategies.concurrent_chunk import (
+    ConcurrentChunkExecutor,
+)
+from lionagi.operatives.strategies.params import RCallParams
+
+
+def test_rcall_params_to_call_kwargs():
+    params = RCallParams(
+        timeout=5, max_retries=2, retry_delay=0.1, retry_backoff=3
+    )
+    assert params.to_call_kwargs() == {
+        "retry_timeout": 5,
+        "num_retries": 2,
+        "retry_delay": 0.1,
+        "backoff_factor": 3,
+    }
+
+
+async def test_concurrent_chunk_execute_end_to_end():
+    instructs = [Instruct(instruction=f"task {i}") for i in range(5)]
+    executor = ConcurrentChunkExecutor(
+        params={
+            "instruct": instructs,
+            "chunk_size": 2,
+            "verbose": False,
+            "rcall_params": {"max_retries": 1, "retry_delay": 0},
+        }
+    )
+    attempts = []
+
+    async def fake_execute_instruct(self, ins, branch, auto_run, **kwargs):
+        # Retry settings configure bcall and must not leak into the call
+        assert kwargs == {}
+        attempts.append(ins.instruction)
+        if ins.instruction == "task 3" and attempts.count("task 3") == 1:
+            raise RuntimeError("transient failure")
+        return ins.instruction.upper()
+
+    with patch.object(
+        ConcurrentChunkExecutor, "execute_instruct", fake_execute_instruct
+    ):
+        result_instructs, responses = await executor.execute(
+            SimpleNamespace(instruct_models=instructs)
+        )
+
+    assert result_instructs == instructs
+    assert all(isinstance(r, InstructResponse) for r in responses)
+    assert [r.instruct for r in responses] == instructs
+    assert [r.response for r in responses] == [f"TASK {i}" for i in range(5)]
+    assert attempts.count("task 3") == 2
@@ -1,5 +1,5 @@
-from datetime import datetime
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid1, uuid4
 
 import pytest
 
@@ -11,6 +11,12 @@ from lionagi.protocols.generic.element import (
 )
 
 
+@pytest.fixture(scope="module")
+def now():
+    """One aware timestamp shared by the tests in this module."""
+    return datetime.now(timezone.utc)
+
+
 def test_idtype_creation():
     id_type = IDType.create()
     assert isinstance(id_type, IDType)
@@ -23,6 +29,13 @@ def test_idtype_validation():
     assert str(id_type) == uuid_str
 
 
+def test_idtype_validation_from_uuid():
+    v4 = uuid4()
+    assert IDType.validate(v4)._id is v4
+    v1 = uuid1()
+    assert IDType.validate(v1)._id == UUID(str(v1), version=4)
+
+
 def test_element_creation():
     element = Element()
     assert isinstance(element.id, IDType)
@@ -35,10 +48,30 @@ def test_element_metadata_validation():
     assert element.metadata == {"key": "value"}
 
 
-def test_element_timestamp():
-    now = datetime.now().timestamp()
+def test_element_timestamp(now):
     element = Element()
-    assert element.created_at >= now
+    assert element.created_at >= now.timestamp()
+
+
+def test_element_with_datetime(now):
+    element = Element(created_at=now)
+    assert element.created_at == now.timestamp()
+    assert element.created_datetime == datetime.fromtimestamp(
+        now.timestamp()
+    )
+
+
+@pytest.mark.parametrize(
+    "tz", [timezone.utc, timezone(timedelta(hours=-5)), None]
+)
+def test_element_with_timezone(now, tz):
+    # tz=None passes the same instant as a naive local datetime
+    dt = now.astimezone(tz)
+    if tz is None:
+        dt = dt.replace(tzinfo=None)
+    element = Element(created_at=dt)
+    assert element.created_at == now.timestamp()
+    assert element.created_datetime.tzinfo is None
 
 
 def test_element_equality():
@@ -105,6 +138,8 @@ def test_validate_order_invalid_input():
 def test_element_hash():
     element = Element()
     assert hash(element) == hash(element.id)
+    assert hash(element.id) == hash(element.id._id)
+    assert {element.id: 1}[IDType.validate(str(element.id))] == 1
 
 
 def test_element_bool():
@@ -118,3 +153,9 @@ def test_element_class_name():
         Element.class_name(full=True)
         == "lionagi.protocols.generic.element.Element"
     )
+
+
+def test_element_created_datetime():
+    element = Element(created_at=0.0)
+    assert element.created_datetime == datetime.fromtimestamp(0.0)
+    assert element.created_datetime is element.created_datetime